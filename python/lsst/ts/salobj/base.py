@@ -40,20 +40,27 @@ __all__ = [
     "current_tai",
     "tai_from_utc",
     "tai_from_utc_unix",
+    "tai_from_utc_unix_array",
 ]
 
 import asyncio
 import bisect
-import datetime
+import calendar
+import dataclasses
+import functools
 import getpass
+import itertools
 import logging
-import math
+import operator
 import re
 import socket
+import string
 import subprocess
 import threading
 import time
 
+import numpy as np
+
 import astropy.time
 import astropy.utils.iers
 import astropy.coordinates
@@ -72,34 +79,56 @@ MAX_SAL_INDEX = (1 << 31) - 1
 
 SECONDS_PER_DAY = 24 * 60 * 60
 
-# MJD - unix seconds, in seconds
-MJD_MINUS_UNIX_SECONDS = (
-    astropy.time.Time(0, scale="utc", format="unix").utc.mjd * SECONDS_PER_DAY
-)
+# MJD - unix seconds, in seconds.
+# The unix epoch 1970-01-01 is MJD 40587.
+MJD_MINUS_UNIX_SECONDS = 40587.0 * SECONDS_PER_DAY
 
-# Regex for a SAL component name encoded as <name>[:<index>]
-_NAME_REGEX = re.compile(r"(?P<name>[a-zA-Z_-][a-zA-Z0-9_-]*)(:(?P<index>\d+))?$")
+# Allowed characters for the first character of a SAL component name,
+# and for the remaining characters, as used by `name_to_name_index`.
+_NAME_FIRST_CHARS = frozenset(string.ascii_letters + "_-")
+_NAME_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
 
 # OpenSplice version; None until get_opensplice_version is first called.
 _OPENSPLICE_VERSION = None
 
-# A table of leap seconds used by `tai_from_utc_unix`.
-# The table is automatically updated by `_update_leap_second_table`.
+# The leap second table: a `_LeapSecondTable`.
+# The table is automatically updated by `_update_leap_second_table`,
+# which replaces it with a new instance (never modifies it in place),
+# so code that uses it need only obtain a local reference.
 _LEAP_SECOND_TABLE = None
 # A threading timer that schedules automatic update of the leap second table.
 _LEAP_SECOND_TABLE_UPDATE_TIMER = None
 # When to update the leap second table, in days before expiration.
 _LEAP_SECOND_TABLE_UPDATE_MARGIN_DAYS = 10
+# Minimum delay before updating the leap second table (seconds).
+# This prevents rapidly repeated updates if AstroPy cannot obtain
+# a table that expires more than the update margin in the future.
+_LEAP_SECOND_TABLE_MIN_UPDATE_DELAY = 60 * 60
+# A lock that prevents concurrent updates of the leap second table
+# (e.g. by the timer thread and by a user).
+_LEAP_SECOND_TABLE_UPDATE_LOCK = threading.Lock()
 
 _MIDDLE_WRAP_ANGLE = astropy.coordinates.Angle(180, u.deg)
 _POSITIVE_WRAP_ANGLE = astropy.coordinates.Angle(360, u.deg)
 
 
+# Get the fields of an ackcmd that are shown by `_ackcmd_str`.
+_get_ackcmd_fields = operator.attrgetter("private_seqNum", "ack", "error", "result")
+
+# Dict of ack code: repr of the equivalent SalRetCode, for `_ackcmd_str`.
+_SAL_RET_CODE_REPRS = {code.value: repr(code) for code in sal_enums.SalRetCode}
+
+
 def _ackcmd_str(ackcmd):
     """Format an Ack as a string"""
+    private_seqNum, ack, error, result = _get_ackcmd_fields(ackcmd)
+    # Equivalent to repr(sal_enums.as_salRetCode(ack)), but faster.
+    ack_repr = _SAL_RET_CODE_REPRS.get(ack)
+    if ack_repr is None:
+        ack_repr = repr(ack)
     return (
-        f"(ackcmd private_seqNum={ackcmd.private_seqNum}, "
-        f"ack={sal_enums.as_salRetCode(ackcmd.ack)!r}, error={ackcmd.error}, result={ackcmd.result!r})"
+        f"(ackcmd private_seqNum={private_seqNum}, "
+        f"ack={ack_repr}, error={error}, result={result!r})"
     )
 
 
@@ -204,7 +233,7 @@ def astropy_time_from_tai_unix(tai_unix):
 
     Parameters
     ----------
-    tai_unix : `float`
+    tai_unix : `float` or `numpy.ndarray`
         TAI time as unix seconds, e.g. the time returned by CLOCK_TAI
         on linux systems.
     """
@@ -281,21 +310,18 @@ def index_generator(imin=1, imax=MAX_SAL_INDEX, i0=None):
     if not imin <= i0 <= imax:
         raise ValueError(f"i0={i0} must be >= imin={imin} and <= imax={imax}")
 
-    # define an inner generator and return that
-    # in order to get immediate argument checking
-    def index_impl():
-        index = i0 - 1
-        while True:
-            index += 1
-            if index > imax:
-                index = imin
-
-            yield index
-
-    return index_impl()
+    # Chain C-level iterators, rather than using a Python generator,
+    # so that each call to next is fast (this is used for seqNum).
+    # Note that itertools.cycle is not used because it saves
+    # a copy of every item.
+    return itertools.chain(
+        range(i0, imax + 1),
+        itertools.chain.from_iterable(itertools.repeat(range(imin, imax + 1))),
+    )
 
 
 def make_done_future():
+    """Return a future that is done, with a result of `None`."""
     future = asyncio.Future()
     future.set_result(None)
     return future
@@ -326,14 +352,19 @@ def name_to_name_index(name):
     * ``"Script:15 " -> raise ValueError (trailing space)``
     * ``"Script:" -> raise ValueError (colon with no index)``
     * ``"Script:zero" -> raise ValueError (index not an integer)``
+    * ``"Script:\\u0661" -> raise ValueError (index not ASCII digits)``
+    * ``"Script\\n" -> raise ValueError (trailing newline)``
     """
-    match = _NAME_REGEX.match(name)
-    if not match:
+    base_name, sep, index_str = name.partition(":")
+    if (
+        not base_name
+        or base_name[0] not in _NAME_FIRST_CHARS
+        or not _NAME_CHARS.issuperset(base_name)
+        or (sep and not (index_str.isascii() and index_str.isdigit()))
+    ):
         raise ValueError(f"name {name!r} is not of the form 'name' or 'name:index'")
-    name = match["name"]
-    index = match["index"]
-    index = 0 if index is None else int(index)
-    return (name, index)
+    index = int(index_str) if sep else 0
+    return (base_name, index)
 
 
 def current_tai_from_utc():
@@ -346,8 +377,8 @@ def tai_from_utc(utc, format="unix"):
 
     Parameters
     ----------
-    utc : `float`, `str` or `astropy.time.Time`
-        UTC time in the specified format.
+    utc : `float`, `int`, `numpy.ndarray`, `str` or `astropy.time.Time`
+        UTC time(s) in the specified format.
     format : `str` or `None`
         Format of the UTC time, as an `astropy.time` format name,
         or `None` to have astropy guess.
@@ -355,8 +386,10 @@ def tai_from_utc(utc, format="unix"):
 
     Returns
     -------
-    tai_unix : `float`
+    tai_unix : `float` or `numpy.ndarray`
         TAI time in unix seconds.
+        An array if ``utc`` is an array or an array-valued
+        `astropy.time.Time`, else a float.
 
     Raises
     ------
@@ -368,8 +401,10 @@ def tai_from_utc(utc, format="unix"):
     Notes
     -----
     If you have UTC in floating point format and performance is an issue,
-    please call `tai_from_utc_unix` to avoid the overhead of converting
-    your time to an `astropy.time.Time`.
+    please call `tai_from_utc_unix` (or `tai_from_utc_unix_array`
+    for arrays). This function calls those directly if ``format="unix"``
+    and ``utc`` is a number or numpy array, but there is some overhead
+    in checking the type.
 
     This function will be deprecated once we upgrade to a version of
     ``astropy`` that supports TAI seconds. `tai_from_utc_unix` will remain.
@@ -405,13 +440,20 @@ def tai_from_utc(utc, format="unix"):
 
     The leap second table is automatically updated.
     """
-    if isinstance(utc, float) and format == "unix":
-        utc_unix = utc
-    elif isinstance(utc, astropy.time.Time):
+    if format == "unix":
+        # Fast paths that avoid constructing an astropy.time.Time.
+        if isinstance(utc, (float, int, np.floating, np.integer)):
+            return tai_from_utc_unix(float(utc))
+        if isinstance(utc, np.ndarray):
+            return tai_from_utc_unix_array(utc)
+
+    if isinstance(utc, astropy.time.Time):
         utc_unix = utc.unix
     else:
         utc_unix = astropy.time.Time(utc, scale="utc", format=format).unix
-    return tai_from_utc_unix(utc_unix)
+    if np.ndim(utc_unix) > 0:
+        return tai_from_utc_unix_array(utc_unix)
+    return tai_from_utc_unix(float(utc_unix))
 
 
 def tai_from_utc_unix(utc_unix):
@@ -439,38 +481,169 @@ def tai_from_utc_unix(utc_unix):
     See the notes for `tai_from_utc` for information about
     possibly unexpected behavior on the day before a leap second.
     """
-    # Use a local pointer, to prevent race conditions while the
-    # global table is being replaced by `_update_leap_second_table`.
-    leap_second_table = _LEAP_SECOND_TABLE
-    if utc_unix > leap_second_table[-1][0] - SECONDS_PER_DAY:
+    table = _LEAP_SECOND_TABLE
+
+    # Fast path for dates after the most recent leap second.
+    min_utc_unix, max_utc_unix, tai_minus_utc = table.current_interval
+    if min_utc_unix <= utc_unix <= max_utc_unix:
+        return float(utc_unix + tai_minus_utc)
+
+    if utc_unix > max_utc_unix:
         raise ValueError(
             f"{utc_unix} > expiry date of leap second table - 1 day "
-            f"= {leap_second_table[-1][0] - SECONDS_PER_DAY}"
+            f"= {max_utc_unix}"
         )
-    i = bisect.bisect(leap_second_table, (utc_unix, math.inf))
+    i = bisect.bisect_right(table.utc, utc_unix)
     if i == 0:
-        raise ValueError(
-            f"{utc_unix} < start of integer leap seconds "
-            f"= {leap_second_table[0][0]}"
-        )
-    utc0, tai_minus_utc0 = leap_second_table[i - 1]
-    utc1, tai_minus_utc1 = leap_second_table[i]
-    if utc_unix + SECONDS_PER_DAY > utc1 and tai_minus_utc1 is not None:
+        raise ValueError(f"{utc_unix} < start of integer leap seconds = {table.utc[0]}")
+    tai_minus_utc0 = table.tai_minus_utc[i - 1]
+    tai_minus_utc1 = table.tai_minus_utc[i]
+    if utc_unix + SECONDS_PER_DAY > table.utc[i] and tai_minus_utc1 is not None:
         # Assume unix seconds is smeared uniformly on the day before a
         # leap second, so that there are exactly 86400 seconds in the day.
         # Otherwise unix seconds is ambiguous at the leap second.
         # This matches AstroPy and Standards of Fundamental Astronomy (SOFA).
-        utc_days = utc_unix / SECONDS_PER_DAY
-        frac_day = utc_days - math.floor(utc_days)
+        frac_day = (utc_unix % SECONDS_PER_DAY) / SECONDS_PER_DAY
         tai_minus_utc = tai_minus_utc0 + (tai_minus_utc1 - tai_minus_utc0) * frac_day
     else:
         tai_minus_utc = tai_minus_utc0
     return float(utc_unix + tai_minus_utc)
 
 
+def tai_from_utc_unix_array(utc_unix):
+    """Return TAI in unix seconds, given an array of UTC in unix seconds.
+
+    A vectorized version of `tai_from_utc_unix`, which is much faster
+    than calling `tai_from_utc_unix` on each element.
+
+    Parameters
+    ----------
+    utc_unix : `numpy.ndarray` or sequence of `float`
+        UTC times in unix seconds.
+
+    Returns
+    -------
+    tai_unix : `numpy.ndarray`
+        TAI times in unix seconds, as an array of float
+        with the same shape as ``utc_unix``.
+
+    Raises
+    ------
+    ValueError
+        If any date is earlier than 1972
+        (which is before integer leap seconds)
+        or within one day of the expiration date of the leap second table
+        (which is automatically updated).
+
+    Notes
+    -----
+    See the notes for `tai_from_utc` for information about
+    possibly unexpected behavior on the day before a leap second.
+    """
+    table = _LEAP_SECOND_TABLE
+    utc_arr = table.utc_arr
+    tai_minus_utc_arr = table.tai_minus_utc_arr
+    utc_unix = np.asarray(utc_unix, dtype=float)
+    max_utc_unix = table.current_interval[1]
+    too_late = utc_unix > max_utc_unix
+    if np.any(too_late):
+        raise ValueError(
+            f"{utc_unix[too_late].flat[0]} > expiry date of leap second table - 1 day "
+            f"= {max_utc_unix}"
+        )
+    too_early = utc_unix < utc_arr[0]
+    if np.any(too_early):
+        raise ValueError(
+            f"{utc_unix[too_early].flat[0]} < start of integer leap seconds "
+            f"= {utc_arr[0]}"
+        )
+    i = np.searchsorted(utc_arr, utc_unix, side="right")
+    tai_minus_utc0 = tai_minus_utc_arr[i - 1]
+    tai_minus_utc1 = tai_minus_utc_arr[i]
+    # Smear TAI-UTC on the day before a leap second;
+    # see `tai_from_utc_unix` for details.
+    smear = (utc_unix + SECONDS_PER_DAY > utc_arr[i]) & ~np.isnan(tai_minus_utc1)
+    frac_day = (utc_unix % SECONDS_PER_DAY) / SECONDS_PER_DAY
+    tai_minus_utc = np.where(
+        smear,
+        tai_minus_utc0 + (tai_minus_utc1 - tai_minus_utc0) * frac_day,
+        tai_minus_utc0,
+    )
+    return utc_unix + tai_minus_utc
+
+
 _log = logging.getLogger("lsst.ts.salobj.base")
 
 
+@dataclasses.dataclass(frozen=True, eq=False)
+class _LeapSecondTable:
+    """A leap second table, in several forms.
+
+    Construct using `from_rows`.
+
+    Attributes
+    ----------
+    utc : `tuple` [`float`]
+        UTC unix seconds of each leap second, in increasing order,
+        followed by the expiry date of the table.
+    tai_minus_utc : `tuple` [`float` or `None`]
+        TAI-UTC seconds starting at each date in ``utc``;
+        None for the final entry (the expiry date of the table).
+    utc_arr : `numpy.ndarray`
+        ``utc`` as an array.
+    tai_minus_utc_arr : `numpy.ndarray`
+        ``tai_minus_utc`` as an array, with nan for the final entry.
+    current_interval : `tuple` [`float`]
+        The most recent interval in which TAI-UTC is constant:
+        (min UTC unix seconds, max UTC unix seconds, TAI-UTC seconds),
+        where max UTC is one day before the table expires.
+        This allows skipping a search of the table for current dates.
+    """
+
+    utc: tuple
+    tai_minus_utc: tuple
+    utc_arr: np.ndarray
+    tai_minus_utc_arr: np.ndarray
+    current_interval: tuple
+
+    @classmethod
+    def from_rows(cls, rows):
+        """Make a leap second table from a sequence of rows.
+
+        Parameters
+        ----------
+        rows : sequence [`tuple`]
+            (UTC unix seconds, TAI-UTC seconds) for each leap second,
+            in increasing order, followed by a final row:
+            (expiry date of the table in UTC unix seconds, None).
+        """
+        # Store Python floats, rather than numpy scalars (as AstroPy
+        # provides), because arithmetic and comparisons on numpy scalars
+        # are much slower, which matters for `tai_from_utc_unix`.
+        utc = tuple(float(row[0]) for row in rows)
+        tai_minus_utc = tuple(None if row[1] is None else float(row[1]) for row in rows)
+        utc_arr = np.array(utc, dtype=float)
+        tai_minus_utc_arr = np.array(
+            [np.nan if value is None else value for value in tai_minus_utc],
+            dtype=float,
+        )
+        utc_arr.flags.writeable = False
+        tai_minus_utc_arr.flags.writeable = False
+        return cls(
+            utc=utc,
+            tai_minus_utc=tai_minus_utc,
+            utc_arr=utc_arr,
+            tai_minus_utc_arr=tai_minus_utc_arr,
+            # There is no leap second at the expiry date,
+            # so TAI-UTC is constant up to one day before the table expires.
+            current_interval=(
+                utc[-2],
+                utc[-1] - SECONDS_PER_DAY,
+                tai_minus_utc[-2],
+            ),
+        )
+
+
 def _update_leap_second_table():
     """Update the leap second table.
 
@@ -480,42 +653,50 @@ def _update_leap_second_table():
     When called, it obtains the current table from AstroPy,
     then schedules a background (daemon) thread to call itself
     to update the table ``_LEAP_SECOND_TABLE_UPDATE_MARGIN_DAYS``
-    before the table expires.
+    before the table expires (but no sooner than
+    ``_LEAP_SECOND_TABLE_MIN_UPDATE_DELAY`` seconds from now).
+    It is thread safe.
 
     The leap table will typically have an expiry date that is
     many months away, so it will be rare for auto update to occur.
     """
-    _log.info("Update leap second table")
     global _LEAP_SECOND_TABLE, _LEAP_SECOND_TABLE_UPDATE_TIMER
-    ap_table = astropy.utils.iers.LeapSeconds.auto_open()
-    lp_list = [
-        (
-            astropy.time.Time(
-                datetime.datetime(row["year"], row["month"], 1, 0, 0, 0), scale="utc"
-            ).unix,
-            row["tai_utc"],
+    with _LEAP_SECOND_TABLE_UPDATE_LOCK:
+        _log.info("Update leap second table")
+        ap_table = astropy.utils.iers.LeapSeconds.auto_open()
+        # Compute unix seconds with calendar.timegm, which is much faster
+        # than constructing an astropy.time.Time for each row.
+        lp_list = [
+            (
+                float(calendar.timegm((row["year"], row["month"], 1, 0, 0, 0))),
+                row["tai_utc"],
+            )
+            for row in ap_table
+            if row["year"] >= 1972
+        ]
+        expiry_date_utc_unix = ap_table.expires.unix
+        lp_list.append((expiry_date_utc_unix, None))
+        # Publish the new table by rebinding the global;
+        # the table is never modified in place.
+        _LEAP_SECOND_TABLE = _LeapSecondTable.from_rows(lp_list)
+
+        update_date = (
+            expiry_date_utc_unix
+            - _LEAP_SECOND_TABLE_UPDATE_MARGIN_DAYS * SECONDS_PER_DAY
         )
-        for row in ap_table
-        if row["year"] >= 1972
-    ]
-    expiry_date_utc_unix = ap_table.expires.unix
-    lp_list.append((expiry_date_utc_unix, None))
-    _LEAP_SECOND_TABLE = lp_list
-
-    update_date = (
-        expiry_date_utc_unix - _LEAP_SECOND_TABLE_UPDATE_MARGIN_DAYS * SECONDS_PER_DAY
-    )
-    update_delay = update_date - time.time()
-    if _LEAP_SECOND_TABLE_UPDATE_TIMER is not None:
-        _LEAP_SECOND_TABLE_UPDATE_TIMER.cancel()
-    _log.debug(
-        f"Schedule a timer to call _update_leap_second_table in {update_delay} seconds"
-    )
-    _LEAP_SECOND_TABLE_UPDATE_TIMER = threading.Timer(
-        update_delay, _update_leap_second_table
-    )
-    _LEAP_SECOND_TABLE_UPDATE_TIMER.daemon = True
-    _LEAP_SECOND_TABLE_UPDATE_TIMER.start()
+        update_delay = max(
+            update_date - time.time(), _LEAP_SECOND_TABLE_MIN_UPDATE_DELAY
+        )
+        if _LEAP_SECOND_TABLE_UPDATE_TIMER is not None:
+            _LEAP_SECOND_TABLE_UPDATE_TIMER.cancel()
+        _log.debug(
+            f"Schedule a timer to call _update_leap_second_table in {update_delay} seconds"
+        )
+        _LEAP_SECOND_TABLE_UPDATE_TIMER = threading.Timer(
+            update_delay, _update_leap_second_table
+        )
+        _LEAP_SECOND_TABLE_UPDATE_TIMER.daemon = True
+        _LEAP_SECOND_TABLE_UPDATE_TIMER.start()
 
 
 _update_leap_second_table()
@@ -541,9 +722,10 @@ def _get_current_tai_function():
         # meanwhile, the standard value 11 works just fine.
         clock_tai = getattr(time, "CLOCK_TAI", 11)
 
-        def system_tai():
-            """Return current TAI in unix seconds, using clock_gettime."""
-            return time.clock_gettime(clock_tai)
+        # Use functools.partial rather than a wrapper function,
+        # to avoid the overhead of an extra Python function call.
+        system_tai = functools.partial(time.clock_gettime, clock_tai)
+        system_tai.__doc__ = "Return current TAI in unix seconds, using clock_gettime."
 
         # Call current_tai_from_utc once before using the returned value,
         # to make sure the leap second table is downloaded.
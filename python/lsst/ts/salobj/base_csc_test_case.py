@@ -421,18 +421,33 @@ class BaseCscTestCase(metaclass=abc.ABCMeta):
         -----
         If a command appears in both lists, it is considered a good command,
         so it is skipped.
+
+        The commands are sent concurrently.
         """
         if bad_commands is None:
             bad_commands = self.remote.salinfo.command_names
         if good_commands is None:
             good_commands = ()
-        commands = self.remote.salinfo.command_names
-        for command in commands:
-            if command in good_commands:
-                continue
+        commands = [command for command in bad_commands if command not in good_commands]
+        state = self.csc.summary_state
+        # Each command is rejected without changing the CSC's state,
+        # so send them all at once rather than waiting for each ack in turn.
+        results = await asyncio.gather(
+            *[
+                getattr(self.remote, f"cmd_{command}").start(timeout=STD_TIMEOUT)
+                for command in commands
+            ],
+            return_exceptions=True,
+        )
+        for command, result in zip(commands, results):
             with self.subTest(command=command):
-                cmd_attr = getattr(self.remote, f"cmd_{command}")
-                with testutils.assertRaisesAckError(
-                    ack=sal_enums.SalRetCode.CMD_FAILED
-                ):
-                    await cmd_attr.start(timeout=STD_TIMEOUT)
+                if not isinstance(result, base.AckError):
+                    self.fail(
+                        f"Command {command} was not rejected in state {state.name}; "
+                        f"result={result!r}"
+                    )
+                self.assertEqual(
+                    result.ackcmd.ack,
+                    sal_enums.SalRetCode.CMD_FAILED,
+                    msg=f"Command {command} in state {state.name}",
+                )
@@ -100,6 +100,10 @@ class BaseScript(controller.Controller, abc.ABC):
             self.config_validator = validator.DefaultingValidator(schema=schema)
         self._run_task = None
         self._pause_future = None
+        # Compiled checkpoints.pause and checkpoints.stop regexes;
+        # set by `_set_checkpoints` and used by `checkpoint`.
+        self._pause_regex = re.compile("")
+        self._stop_regex = re.compile("")
         # Value incremented by `next_supplemented_group_id`
         # and cleared by do_setGroupId.
         self._sub_group_id = 0
@@ -334,12 +338,12 @@ class BaseScript(controller.Controller, abc.ABC):
                 "checkpoint error: state is RUNNING but run_task is done"
             )
 
-        if re.fullmatch(self.checkpoints.stop, name):
+        if self._stop_regex.fullmatch(name):
             self.set_state(ScriptState.STOPPING, last_checkpoint=name)
             raise asyncio.CancelledError(
                 f"stop by request: checkpoint {name} matches {self.checkpoints.stop}"
             )
-        elif re.fullmatch(self.checkpoints.pause, name):
+        elif self._pause_regex.fullmatch(name):
             self._pause_future = asyncio.Future()
             self.set_state(ScriptState.PAUSED, last_checkpoint=name)
             await self._pause_future
@@ -684,13 +688,15 @@ class BaseScript(controller.Controller, abc.ABC):
             If pause or stop are not valid regular expressions.
         """
         try:
-            re.compile(pause)
+            pause_regex = re.compile(pause)
         except Exception as e:
             raise base.ExpectedError(f"pause={pause!r} not a valid regex: {e}")
         try:
-            re.compile(stop)
+            stop_regex = re.compile(stop)
         except Exception as e:
             raise base.ExpectedError(f"stop={stop!r} not a valid regex: {e}")
+        self._pause_regex = pause_regex
+        self._stop_regex = stop_regex
         self.evt_checkpoints.set_put(pause=pause, stop=stop, force_output=True)
 
     async def _heartbeat_loop(self):
@@ -36,6 +36,9 @@ OPTIONAL_COMMAND_NAMES = set(("abort", "enterControl", "setValue", "setSimulatio
 
 # Delay before closing the domain participant (seconds).
 # This gives remotes time to read final DDS messages before they disappear.
+# Each Controller has its own Domain and waits independently,
+# so close multiple controllers concurrently (e.g. with `asyncio.gather`)
+# to overlap these delays.
 SHUTDOWN_DELAY = 1
 
 
@@ -66,6 +69,11 @@ def parse_as_prefix_and_set(items_str):
     return prefix, data_set
 
 
+def _reject_command(data):
+    """Command callback for optional commands with no do_ method."""
+    raise base.ExpectedError("Not supported by this CSC")
+
+
 class Controller:
     """A class that receives commands for a SAL component
     and sends telemetry and events from that component.
@@ -194,17 +202,26 @@ class Controller:
                 # have been added.
                 self._assert_do_methods_present()
 
-            for cmd_name in self.salinfo.command_names:
-                cmd = ControllerCommand(self.salinfo, cmd_name)
-                setattr(self, cmd.attr_name, cmd)
-
-            for evt_name in self.salinfo.event_names:
-                evt = ControllerEvent(self.salinfo, evt_name)
-                setattr(self, evt.attr_name, evt)
-
-            for tel_name in self.salinfo.telemetry_names:
-                tel = ControllerTelemetry(self.salinfo, tel_name)
-                setattr(self, tel.attr_name, tel)
+            # Add all topic attributes with a single dict update.
+            # Construct the topics now, rather than lazily on first access:
+            # command readers must be added before `SalInfo.start`
+            # is called, and event and telemetry writers should exist
+            # early, so DDS can match them to remote readers before
+            # the first message is written (else volatile topics
+            # may lose messages).
+            topics = [
+                ControllerCommand(self.salinfo, cmd_name)
+                for cmd_name in self.salinfo.command_names
+            ]
+            topics += [
+                ControllerEvent(self.salinfo, evt_name)
+                for evt_name in self.salinfo.event_names
+            ]
+            topics += [
+                ControllerTelemetry(self.salinfo, tel_name)
+                for tel_name in self.salinfo.telemetry_names
+            ]
+            self.__dict__.update((topic.attr_name, topic) for topic in topics)
 
             for required_name in ("logMessage", "logLevel", "authList"):
                 if not hasattr(self, f"evt_{required_name}"):
@@ -302,6 +319,10 @@ class Controller:
         Removes the SAL log handler, calls `close_tasks` to stop
         all background tasks, pauses briefly to allow final SAL messages
         to be sent, then closes the dds domain.
+
+        The pause is specific to this controller, so if you have
+        several controllers to close, it is much faster to close them
+        concurrently (e.g. using `asyncio.gather`) than one at a time.
         """
         if self.start_task is None:
             # Not fully constructed; nothing to do.
@@ -421,22 +442,27 @@ class Controller:
 
     def _assert_do_methods_present(self):
         """Assert that all needed do_<name> methods are present."""
-        command_names = self.salinfo.command_names
-        do_names = [name for name in dir(self) if name.startswith("do_")]
-        supported_command_names = [name[3:] for name in do_names]
-        if set(command_names) != set(supported_command_names):
+        # Search the instance and class dicts, rather than calling dir(self),
+        # which is much slower because it builds and sorts a list
+        # of all attributes.
+        supported_command_names = {
+            name[3:]
+            for namespace in (vars(self), *(vars(cls) for cls in type(self).__mro__))
+            for name in namespace
+            if name.startswith("do_")
+        }
+        command_names = set(self.salinfo.command_names)
+        if command_names != supported_command_names:
             err_msgs = []
             unsupported_commands = (
-                set(command_names)
-                - set(supported_command_names)
-                - OPTIONAL_COMMAND_NAMES
+                command_names - supported_command_names - OPTIONAL_COMMAND_NAMES
             )
             if unsupported_commands:
                 needed_do_str = ", ".join(
                     f"do_{name}" for name in sorted(unsupported_commands)
                 )
                 err_msgs.append(f"must add {needed_do_str} methods")
-            extra_commands = sorted(set(supported_command_names) - set(command_names))
+            extra_commands = supported_command_names - command_names
             if extra_commands:
                 extra_do_str = ", ".join(
                     f"do_{name}" for name in sorted(extra_commands)
@@ -462,11 +488,7 @@ class Controller:
             elif cmd_name not in OPTIONAL_COMMAND_NAMES:
                 raise RuntimeError(f"Can't find method {do_method_name}")
             else:
-
-                def reject_command(data):
-                    raise base.ExpectedError("Not supported by this CSC")
-
-                cmd.callback = reject_command
+                cmd.callback = _reject_command
 
     async def __aenter__(self):
         await self.start_task
@@ -19,12 +19,53 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-__all__ = ["get_dds_version"]
+__all__ = ["get_dds_classes_from_idl", "get_dds_version"]
 
+import functools
+import os
 import pathlib
 import re
 
 import dds
+import ddsutil
+
+
+def get_dds_classes_from_idl(idl_path, type_name):
+    """Get the DDS classes for one topic, parsing the IDL file at need.
+
+    A cached version of ``ddsutil.get_dds_classes_from_idl``.
+
+    Parameters
+    ----------
+    idl_path : `str` or `pathlib.Path`
+        Path to IDL file.
+    type_name : `str`
+        Topic type name, e.g. "Test::logevent_summaryState_<hash>".
+
+    Returns
+    -------
+    dds_classes : ``ddsutil`` topic information
+        The value returned by ``ddsutil.get_dds_classes_from_idl``.
+
+    Notes
+    -----
+    Generating the classes requires parsing the IDL file, which is slow.
+    The result is cached, keyed by the arguments and the modification time
+    of the IDL file, so each topic type is only generated once per process
+    (unless the IDL file changes).
+    """
+    return _get_dds_classes_from_idl_cached(
+        idl_path, type_name, os.stat(idl_path).st_mtime_ns
+    )
+
+
+@functools.lru_cache(maxsize=1000)
+def _get_dds_classes_from_idl_cached(idl_path, type_name, mtime_ns):
+    """Cached implementation of `get_dds_classes_from_idl`.
+
+    ``mtime_ns`` is only used as part of the cache key.
+    """
+    return ddsutil.get_dds_classes_from_idl(idl_path, type_name)
 
 
 def get_dds_version(dds_file=None):
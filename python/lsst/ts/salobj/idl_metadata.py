@@ -21,6 +21,8 @@
 
 __all__ = ["IdlMetadata", "TopicMetadata", "FieldMetadata", "parse_idl"]
 
+import functools
+import os
 import re
 
 
@@ -76,6 +78,8 @@ class TopicMetadata:
         Dict of field name: field metadata.
     """
 
+    __slots__ = ("sal_name", "version_hash", "description", "field_info")
+
     def __init__(self, sal_name, version_hash, description):
         self.sal_name = sal_name
         self.version_hash = version_hash
@@ -110,6 +114,15 @@ class FieldMetadata:
         or not a string.
     """
 
+    __slots__ = (
+        "name",
+        "description",
+        "units",
+        "type_name",
+        "array_length",
+        "str_length",
+    )
+
     def __init__(self, name, description, units, type_name, array_length, str_length):
         self.name = name
         self.description = description
@@ -146,6 +159,21 @@ def parse_idl(name, idl_path):
     -------
     metadata : `IdlMetadata`
         Parsed metadata.
+
+    Notes
+    -----
+    The result is cached, keyed by the arguments and the modification time
+    of the IDL file, so repeatedly parsing the same unchanged file
+    returns the same `IdlMetadata`. Do not modify the returned metadata.
+    """
+    return _parse_idl_cached(name, idl_path, os.stat(idl_path).st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=100)
+def _parse_idl_cached(name, idl_path, mtime_ns):
+    """Cached implementation of `parse_idl`.
+
+    ``mtime_ns`` is only used as part of the cache key.
     """
     # List of field types used in IDL, excluding "unsigned".
     type_names = (
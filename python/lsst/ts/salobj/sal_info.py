@@ -30,9 +30,9 @@ import time
 import warnings
 
 import dds
-import ddsutil
 
 from . import base
+from . import dds_utils
 from . import idl_metadata
 from .domain import Domain
 
@@ -81,6 +81,15 @@ class FieldMetadata:
         or not a string.
     """
 
+    __slots__ = (
+        "name",
+        "description",
+        "units",
+        "type_name",
+        "array_length",
+        "str_length",
+    )
+
     def __init__(self, name, description, units, type_name, array_length, str_length):
         self.name = name
         self.description = description
@@ -119,6 +128,8 @@ class TopicMetadata:
         Dict of field name: field metadata.
     """
 
+    __slots__ = ("sal_name", "description", "field_info")
+
     def __init__(self, sal_name, description):
         self.sal_name = sal_name
         self.description = description
@@ -328,7 +339,7 @@ class SalInfo:
             ackcmd_revname = self.revnames.get("ackcmd")
             if ackcmd_revname is None:
                 raise RuntimeError(f"Could not find {self.name} topic 'ackcmd'")
-            self._ackcmd_type = ddsutil.get_dds_classes_from_idl(
+            self._ackcmd_type = dds_utils.get_dds_classes_from_idl(
                 idl_path, ackcmd_revname
             )
 
@@ -343,16 +354,18 @@ class SalInfo:
             return
         # Note: ReadTopic's reader filters out ackcmd samples
         # for commands issued by other remotes.
-        if data.identity and data.identity != self.identity:
+        identity = data.identity
+        if identity and identity != self.identity:
             # This ackcmd is for a command issued by a different Remote,
             # so ignore it.
             return
-        cmd_info = self._running_cmds.get(data.private_seqNum, None)
+        private_seqNum = data.private_seqNum
+        cmd_info = self._running_cmds.get(private_seqNum, None)
         if cmd_info is None:
             return
         isdone = cmd_info.add_ackcmd(data)
         if isdone:
-            del self._running_cmds[data.private_seqNum]
+            del self._running_cmds[private_seqNum]
 
     @property
     def AckCmdType(self):
@@ -548,27 +561,32 @@ class SalInfo:
         command_names = []
         event_names = []
         telemetry_names = []
+        sal_topic_names = []
         revnames = {}
-        for topic_metadata in self.metadata.topic_info.values():
-            sal_topic_name = topic_metadata.sal_name
+        for sal_topic_name, topic_metadata in self.metadata.topic_info.items():
+            sal_topic_names.append(sal_topic_name)
             if sal_topic_name.startswith("command_"):
-                command_names.append(sal_topic_name[8:])
+                command_names.append(sal_topic_name[len("command_") :])
             elif sal_topic_name.startswith("logevent_"):
-                event_names.append(sal_topic_name[9:])
+                event_names.append(sal_topic_name[len("logevent_") :])
             elif sal_topic_name != "ackcmd":
                 telemetry_names.append(sal_topic_name)
             revnames[
                 sal_topic_name
             ] = f"{self.name}::{sal_topic_name}_{topic_metadata.version_hash}"
 
-        # Examine last topic (or any topic) to see if component is indexed.
-        indexed_field_name = f"{self.name}ID"
-        self.indexed = indexed_field_name in topic_metadata.field_info
+        # Every topic of an indexed component has the index field,
+        # so examine the first topic to see if the component is indexed.
+        first_topic_metadata = next(iter(self.metadata.topic_info.values()), None)
+        self.indexed = (
+            first_topic_metadata is not None
+            and f"{self.name}ID" in first_topic_metadata.field_info
+        )
 
         self.command_names = tuple(command_names)
         self.event_names = tuple(event_names)
         self.telemetry_names = tuple(telemetry_names)
-        self.sal_topic_names = tuple(sorted(self.metadata.topic_info.keys()))
+        self.sal_topic_names = tuple(sorted(sal_topic_names))
         self.revnames = revnames
 
     def basic_close(self):
@@ -721,11 +739,7 @@ class SalInfo:
                                 "giving up"
                             ) from e
                     self.log.debug(f"Read {len(data_list)} history items for {reader}")
-                    sd_list = [
-                        self._sample_to_data(sd, si)
-                        for sd, si in data_list
-                        if si.valid_data
-                    ]
+                    sd_list = self._samples_to_data(data_list)
                     if len(sd_list) < len(data_list):
                         ninvalid = len(data_list) - len(sd_list)
                         self.log.warning(
@@ -782,13 +796,19 @@ class SalInfo:
         loop : `asyncio.AbstractEventLoop`
             The main asyncio event loop.
         """
+        # Bind attributes used for every sample to local variables.
+        # The set of readers cannot change after `start` is called.
+        wait = self._waitset.wait
+        wait_timeout = self._wait_timeout
+        get_reader = self._reader_dict.get
+        samples_to_data = self._samples_to_data
         while self.isopen:
-            conditions = self._waitset.wait(self._wait_timeout)
+            conditions = wait(wait_timeout)
             if not self.isopen:
                 # shutting down; clean everything up
                 return
             for condition in conditions:
-                reader = self._reader_dict.get(condition)
+                reader = get_reader(condition)
                 if reader is None or not reader.isopen:
                     continue
                 # odds are we will only get one value per read,
@@ -797,24 +817,27 @@ class SalInfo:
                     condition, reader._data_queue.maxlen
                 )
                 reader.dds_queue_length_checker.check_nitems(len(data_list))
-                sd_list = [
-                    self._sample_to_data(sd, si)
-                    for sd, si in data_list
-                    if si.valid_data
-                ]
+                sd_list = samples_to_data(data_list)
                 if sd_list:
                     reader._queue_data(sd_list, loop=loop)
 
-    def _sample_to_data(self, sd, si):
-        """Process one sample data, sample info pair.
+    def _samples_to_data(self, data_list):
+        """Process a list of sample data, sample info pairs.
 
-        Set sd.private_rcvStamp based on si.reception_timestamp
-        and return the updated sd.
+        Skip invalid samples, set sd.private_rcvStamp
+        based on si.reception_timestamp for the others,
+        and return a list of the updated sd.
         """
-        rcv_utc = si.reception_timestamp * 1e-9
-        rcv_tai = base.tai_from_utc_unix(rcv_utc)
-        sd.private_rcvStamp = rcv_tai
-        return sd
+        # Filter and convert in a single pass. This is faster than
+        # converting the reception times with `base.tai_from_utc_unix_array`,
+        # even for batches of 10,000 samples.
+        tai_from_utc_unix = base.tai_from_utc_unix
+        sd_list = []
+        for sd, si in data_list:
+            if si.valid_data:
+                sd.private_rcvStamp = tai_from_utc_unix(si.reception_timestamp * 1e-9)
+                sd_list.append(sd)
+        return sd_list
 
     def _wait_history(self):
         """Wait for historical data to be available for all topics.
@@ -24,6 +24,10 @@ __all__ = ["SalLogHandler"]
 import logging
 import sys
 
+# Formatter used if none has been set on the handler;
+# the same default as `logging.Handler.format`.
+_DEFAULT_FORMATTER = logging.Formatter()
+
 
 class SalLogHandler(logging.Handler):
     """Log handler that outputs an event topic.
@@ -34,23 +38,43 @@ class SalLogHandler(logging.Handler):
         Controller with
         :ref:`Required Logger Attribute<required_logging_attributes>`
         ``evt_logEvent``.
+
+    Notes
+    -----
+    Each record is written as a ``logMessage`` event directly from `emit`,
+    in the thread that logged it. There is no intermediate queue or
+    polling task, so messages are published with no added latency
+    and an idle controller costs nothing.
+
+    If writing the event fails, the error is printed to stderr.
+    Further failures are not reported until a write succeeds again,
+    so a persistent problem (e.g. a closed writer) does not print
+    an error for every log message.
     """
 
     def __init__(self, controller):
         self.controller = controller
+        # Did the most recent call to `emit` fail?
+        self._emit_failed = False
         super().__init__()
 
     def emit(self, record):
         try:
-            self.format(record)
-            if record.exc_text is not None:
+            # Only the message and traceback are published, so format
+            # just those rather than calling ``self.format``,
+            # which also builds a full log line that would be discarded.
+            message = record.getMessage()
+            if record.exc_info and not record.exc_text:
+                formatter = self.formatter or _DEFAULT_FORMATTER
+                record.exc_text = formatter.formatException(record.exc_info)
+            if record.exc_text:
                 traceback = record.exc_text.encode("utf-8", "replace")
             else:
                 traceback = ""
             self.controller.evt_logMessage.set_put(
                 name=record.name,
                 level=record.levelno,
-                message=record.message.encode("utf-8", "replace"),
+                message=message.encode("utf-8", "replace"),
                 traceback=traceback,
                 filePath=record.pathname,
                 functionName=record.funcName,
@@ -58,10 +82,17 @@ class SalLogHandler(logging.Handler):
                 process=record.process,
                 force_output=True,
             )
+            self._emit_failed = False
         except Exception as e:
-            print(f"SalLogHandler.emit failed: {e}", file=sys.stderr)
+            if not self._emit_failed:
+                self._emit_failed = True
+                print(
+                    f"SalLogHandler.emit failed: {e!r}; "
+                    "suppressing further errors until a message is written",
+                    file=sys.stderr,
+                )
         finally:
             # The Python formatter documentation suggests clearing ``exc_text``
-            # after calling ``format`` to avoid problems with
+            # after formatting an exception to avoid problems with
             # multiple formatters that have different exception formats.
             record.exc_text = ""
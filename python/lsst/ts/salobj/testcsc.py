@@ -31,6 +31,22 @@ from .configurable_csc import ConfigurableCsc
 from . import __version__
 from .config_schema import CONFIG_SCHEMA
 
+# Character codes of printable ASCII characters,
+# for generating random strings.
+_PRINTABLE_CODES = np.frombuffer(string.printable.encode(), dtype=np.uint8)
+
+
+def _make_random_string(nchars):
+    """Make a random string of printable ASCII characters.
+
+    Parameters
+    ----------
+    nchars : `int`
+        Number of characters.
+    """
+    indices = np.random.randint(0, len(_PRINTABLE_CODES), size=nchars)
+    return _PRINTABLE_CODES[indices].tobytes().decode()
+
 
 class TestCsc(ConfigurableCsc):
     """A simple CSC intended for unit testing.
@@ -76,6 +92,17 @@ class TestCsc(ConfigurableCsc):
         instead of the ``config_schema`` argument.
 
 
+    Attributes
+    ----------
+    field_type : `dict` [`str`, `type`]
+        Dict of field name: element type.
+    arrays_fields : `tuple` [`str`]
+        The fields in an arrays struct.
+    scalars_fields : `tuple` [`str`]
+        The fields in a scalars struct.
+    int_fields : `tuple` [`str`]
+        The integer fields in a struct.
+
     Raises
     ------
     ValueError
@@ -108,6 +135,67 @@ class TestCsc(ConfigurableCsc):
     version = __version__
     __test__ = False  # stop pytest from warning that this is not a test
 
+    field_type = dict(
+        boolean0=bool,
+        byte0=np.uint8,
+        char0=str,
+        short0=np.int16,
+        int0=np.int32,
+        long0=np.int32,
+        longLong0=np.int64,
+        octet0=np.uint8,
+        unsignedShort0=np.uint16,
+        unsignedInt0=np.uint32,
+        unsignedLong0=np.uint32,
+        float0=np.single,
+        double0=np.double,
+        string0=str,
+    )
+
+    arrays_fields = (
+        "boolean0",
+        "byte0",
+        "short0",
+        "int0",
+        "long0",
+        "longLong0",
+        "octet0",
+        "unsignedShort0",
+        "unsignedInt0",
+        "unsignedLong0",
+        "float0",
+        "double0",
+    )
+
+    scalars_fields = (
+        "boolean0",
+        "byte0",
+        "char0",
+        "short0",
+        "int0",
+        "long0",
+        "longLong0",
+        "octet0",
+        "unsignedShort0",
+        "unsignedInt0",
+        "unsignedLong0",
+        "float0",
+        "double0",
+        "string0",
+    )
+
+    int_fields = (
+        "byte0",
+        "short0",
+        "int0",
+        "long0",
+        "longLong0",
+        "octet0",
+        "unsignedShort0",
+        "unsignedInt0",
+        "unsignedLong0",
+    )
+
     def __init__(
         self,
         index,
@@ -121,7 +209,6 @@ class TestCsc(ConfigurableCsc):
             config_kwargs = dict(schema_path=schema_path)
         else:
             config_kwargs = dict(config_schema=CONFIG_SCHEMA)
-        print("config_kwargs=", config_kwargs)
         super().__init__(
             "Test",
             config_dir=config_dir,
@@ -164,10 +251,7 @@ class TestCsc(ConfigurableCsc):
         fields : `list` [`str`]
             The names of the fields of ``data`` to copy.
         """
-        ret = dict()
-        for field in fields:
-            ret[field] = getattr(data, field)
-        return ret
+        return {field: getattr(data, field) for field in fields}
 
     def do_fault(self, data):
         """Execute the fault command.
@@ -189,79 +273,6 @@ class TestCsc(ConfigurableCsc):
             self.cmd_wait.ack_in_progress(data, timeout=data.duration)
         await asyncio.sleep(abs(data.duration))
 
-    @property
-    def field_type(self):
-        """Get a dict of field_name: element type."""
-        return dict(
-            boolean0=bool,
-            byte0=np.uint8,
-            char0=str,
-            short0=np.int16,
-            int0=np.int32,
-            long0=np.int32,
-            longLong0=np.int64,
-            octet0=np.uint8,
-            unsignedShort0=np.uint16,
-            unsignedInt0=np.uint32,
-            unsignedLong0=np.uint32,
-            float0=np.single,
-            double0=np.double,
-            string0=str,
-        )
-
-    @property
-    def arrays_fields(self):
-        """Get a tuple of the fields in an arrays struct."""
-        return (
-            "boolean0",
-            "byte0",
-            "short0",
-            "int0",
-            "long0",
-            "longLong0",
-            "octet0",
-            "unsignedShort0",
-            "unsignedInt0",
-            "unsignedLong0",
-            "float0",
-            "double0",
-        )
-
-    @property
-    def scalars_fields(self):
-        """Get a tuple of the fields in a scalars struct."""
-        return (
-            "boolean0",
-            "byte0",
-            "char0",
-            "short0",
-            "int0",
-            "long0",
-            "longLong0",
-            "octet0",
-            "unsignedShort0",
-            "unsignedInt0",
-            "unsignedLong0",
-            "float0",
-            "double0",
-            "string0",
-        )
-
-    @property
-    def int_fields(self):
-        """Get a tuple of the integer fields in a struct."""
-        return (
-            "byte0",
-            "short0",
-            "int0",
-            "long0",
-            "longLong0",
-            "octet0",
-            "unsignedShort0",
-            "unsignedInt0",
-            "unsignedLong0",
-        )
-
     def assert_arrays_equal(self, arrays1, arrays2):
         """Assert that two arrays data structs are equal.
 
@@ -338,9 +349,8 @@ class TestCsc(ConfigurableCsc):
         """Make random data for cmd_setScalars using numpy.random."""
         data = dtype()
         data.boolean0 = np.random.choice([False, True])
-        printable_chars = [c for c in string.printable]
-        data.char0 = "".join(np.random.choice(printable_chars, size=(20,)))
-        data.string0 = "".join(np.random.choice(printable_chars, size=(20,)))
+        data.char0 = _make_random_string(20)
+        data.string0 = _make_random_string(20)
         for field in self.int_fields:
             field_type = self.field_type[field]
             iinfo = np.iinfo(field_type)
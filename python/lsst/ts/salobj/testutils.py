@@ -85,13 +85,14 @@ def assertRaisesAckError(ack=None, error=None, result_contains=None):
         yield
         raise AssertionError("AckError not raised")
     except AckError as e:
-        if ack is not None and e.ackcmd.ack != ack:
-            raise AssertionError(f"ackcmd.ack={e.ackcmd.ack} instead of {ack}")
-        if error is not None and e.ackcmd.error != error:
-            raise AssertionError(f"ackcmd.error={e.ackcmd.error} instead of {error}")
-        if result_contains is not None and result_contains not in e.ackcmd.result:
+        ackcmd = e.ackcmd
+        if ack is not None and ackcmd.ack != ack:
+            raise AssertionError(f"ackcmd.ack={ackcmd.ack} instead of {ack}")
+        if error is not None and ackcmd.error != error:
+            raise AssertionError(f"ackcmd.error={ackcmd.error} instead of {error}")
+        if result_contains is not None and result_contains not in ackcmd.result:
             raise AssertionError(
-                f"ackcmd.result={e.ackcmd.result} does not contain {result_contains}"
+                f"ackcmd.result={ackcmd.result} does not contain {result_contains}"
             )
 
 
@@ -111,10 +112,11 @@ def assertRaisesAckTimeoutError(ack=None, error=None):
         yield
         raise AssertionError("AckError not raised")
     except AckTimeoutError as e:
-        if ack is not None and e.ackcmd.ack != ack:
-            raise AssertionError(f"ackcmd.ack={e.ackcmd.ack} instead of {ack}")
-        if error is not None and e.ackcmd.error != error:
-            raise AssertionError(f"ackcmd.error={e.ackcmd.error} instead of {error}")
+        ackcmd = e.ackcmd
+        if ack is not None and ackcmd.ack != ack:
+            raise AssertionError(f"ackcmd.ack={ackcmd.ack} instead of {ack}")
+        if error is not None and ackcmd.error != error:
+            raise AssertionError(f"ackcmd.error={ackcmd.error} instead of {error}")
 
 
 def assert_black_formatted(dirpath):
@@ -23,7 +23,7 @@ __all__ = ["BaseTopic"]
 
 import abc
 
-import ddsutil
+from .. import dds_utils
 
 # dict of sal_prefix: attr_prefix: the prefix used for
 # Controller and Remote topic attributes.
@@ -103,7 +103,7 @@ class BaseTopic(abc.ABC):
             self.dds_name = revname.replace("::", "_")
             self.rev_code = self.dds_name.rsplit("_", 1)[1]
 
-            self._type = ddsutil.get_dds_classes_from_idl(
+            self._type = dds_utils.get_dds_classes_from_idl(
                 salinfo.metadata.idl_path, revname
             )
             self._topic = self._type.register_topic(
@@ -19,6 +19,7 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import asyncio
 import datetime
 import getpass
 import os
@@ -151,6 +152,13 @@ class BasicsTestCase(unittest.IsolatedAsyncioTestCase):
             for item in ("AckError", msg, private_seqNum, ack, error, result):
                 self.assertIn(str(item), repr_err)
 
+    def test_mjd_minus_unix_seconds(self):
+        expected_value = (
+            astropy.time.Time(0, scale="utc", format="unix").utc.mjd
+            * salobj.SECONDS_PER_DAY
+        )
+        self.assertEqual(salobj.MJD_MINUS_UNIX_SECONDS, expected_value)
+
     def test_astropy_time_from_tai_unix(self):
         # Check the function at a leap second transition,
         # since that is likely to cause problems
@@ -165,6 +173,19 @@ class BasicsTestCase(unittest.IsolatedAsyncioTestCase):
                 tai_unix_round_trip1 = salobj.tai_from_utc(astropy_time1)
                 self.assertAlmostEqual(tai_unix, tai_unix_round_trip1, delta=1e-6)
 
+    def test_astropy_time_from_tai_unix_array(self):
+        unix_time0 = datetime.datetime.fromisoformat("2017-01-01").timestamp()
+        utc_unix = unix_time0 + np.array([-1, -0.5, -0.1, 0, 0.1, 1])
+        tai_unix = salobj.tai_from_utc(utc_unix)
+        astropy_times = salobj.astropy_time_from_tai_unix(tai_unix)
+        self.assertIsInstance(astropy_times, astropy.time.Time)
+        self.assertEqual(astropy_times.scale, "tai")
+        self.assertEqual(astropy_times.shape, tai_unix.shape)
+        for tai_unix_item, astropy_time in zip(tai_unix, astropy_times):
+            self.assertEqual(
+                astropy_time, salobj.astropy_time_from_tai_unix(tai_unix_item)
+            )
+
     async def test_get_opensplice_version(self):
         ospl_version = salobj.get_opensplice_version()
         self.assertRegex(ospl_version, r"^\d+\.\d+\.\d+")
@@ -309,6 +330,15 @@ class BasicsTestCase(unittest.IsolatedAsyncioTestCase):
         values = [next(gen) for i in range(len(expected_values))]
         self.assertEqual(values, expected_values)
 
+    async def test_make_done_future(self):
+        future1 = salobj.make_done_future()
+        self.assertTrue(future1.done())
+        self.assertIsNone(future1.result())
+        self.assertIs(future1.get_loop(), asyncio.get_running_loop())
+        self.assertFalse(future1.cancel())
+        self.assertFalse(future1.cancelled())
+        self.assertIsNone(await future1)
+
     def test_name_to_name_index(self):
         for name, expected_result in (
             ("Script", ("Script", 0)),
@@ -326,6 +356,14 @@ class BasicsTestCase(unittest.IsolatedAsyncioTestCase):
             ("Script:15 "),  # trailing space
             ("Script:"),  # colon with no index
             ("Script:zero"),  # index is not an integer
+            ("Script:1:2"),  # more than one colon
+            ("Script:-1"),  # negative index
+            ("1Script"),  # name starts with a digit
+            ("Scr ipt"),  # name contains a space
+            (""),  # empty name
+            (":1"),  # empty name with an index
+            ("Script\n"),  # trailing newline
+            ("Script:\u0661"),  # index is not ASCII digits
         ):
             with self.subTest(bad_name=bad_name):
                 with self.assertRaises(ValueError):
@@ -365,9 +403,31 @@ class BasicsTestCase(unittest.IsolatedAsyncioTestCase):
         tai7 = salobj.tai_from_utc(utc_ap)
         self.assertAlmostEqual(tai, tai7, delta=1e-6)
 
+        tai8 = salobj.tai_from_utc(np.float64(utc_ap.utc.unix))
+        self.assertIs(type(tai8), float)
+        self.assertAlmostEqual(tai, tai8, delta=1e-6)
+
     def test_leap_second_table(self):
         """Check that the leap second table is set and an update scheduled."""
-        self.assertIsNotNone(lsst.ts.salobj.base._LEAP_SECOND_TABLE)
+        leap_second_table = lsst.ts.salobj.base._LEAP_SECOND_TABLE
+        self.assertIsNotNone(leap_second_table)
+        for utc_unix, tai_minus_utc in zip(
+            leap_second_table.utc[0:-1], leap_second_table.tai_minus_utc[0:-1]
+        ):
+            utc = astropy.time.Time(utc_unix, scale="utc", format="unix")
+            self.assertEqual(utc.datetime.day, 1)
+            self.assertEqual(utc.datetime.hour, 0)
+            tai_unix = (
+                utc.tai.mjd * salobj.SECONDS_PER_DAY - salobj.MJD_MINUS_UNIX_SECONDS
+            )
+            self.assertAlmostEqual(tai_unix - utc_unix, tai_minus_utc, delta=1e-6)
+        # The table must hold Python floats, not numpy scalars,
+        # which would slow down tai_from_utc_unix.
+        for value in leap_second_table.utc + leap_second_table.tai_minus_utc[0:-1]:
+            self.assertIs(type(value), float)
+        self.assertIsNone(leap_second_table.tai_minus_utc[-1])
+        for value in leap_second_table.current_interval:
+            self.assertIs(type(value), float)
         update_timer = lsst.ts.salobj.base._LEAP_SECOND_TABLE_UPDATE_TIMER
         self.assertTrue(update_timer.is_alive())
         self.assertTrue(update_timer.daemon)
@@ -378,10 +438,12 @@ class BasicsTestCase(unittest.IsolatedAsyncioTestCase):
             lsst.ts.salobj.base._LEAP_SECOND_TABLE_UPDATE_MARGIN_DAYS
             * salobj.SECONDS_PER_DAY
         )
-        current_duration = (
-            time.time() - lsst.ts.salobj.base._LEAP_SECOND_TABLE[-1][0] - update_margin
-        )
+        current_duration = time.time() - leap_second_table.utc[-1] - update_margin
         self.assertGreater(update_timer.interval, current_duration)
+        self.assertGreaterEqual(
+            update_timer.interval,
+            lsst.ts.salobj.base._LEAP_SECOND_TABLE_MIN_UPDATE_DELAY,
+        )
 
     def test_tai_from_utc(self):
         """Test tai_from_utc."""
@@ -403,20 +465,67 @@ class BasicsTestCase(unittest.IsolatedAsyncioTestCase):
         # and one day before the current leap second table expires.
         min_utc_unix = astropy.time.Time("1972-01-01", scale="utc", format="iso").unix
         max_utc_unix = (
-            lsst.ts.salobj.base._LEAP_SECOND_TABLE[-1][0] - salobj.SECONDS_PER_DAY
+            lsst.ts.salobj.base._LEAP_SECOND_TABLE.utc[-1] - salobj.SECONDS_PER_DAY
         )
         min_tai_unix = salobj.tai_from_utc(min_utc_unix)
         self.assertAlmostEqual(min_tai_unix, min_utc_unix + 10)
+        # An int is treated like a float.
+        min_tai_unix_from_int = salobj.tai_from_utc(int(min_utc_unix))
+        self.assertIs(type(min_tai_unix_from_int), float)
+        self.assertAlmostEqual(min_tai_unix_from_int, int(min_utc_unix) + 10)
         max_tai_unix = salobj.tai_from_utc(max_utc_unix)
         # Final value of TAI-UTC in the table.
         # Note that the last entry in the table has TAI-UTC = None.
-        final_tai_minus_utc = lsst.ts.salobj.base._LEAP_SECOND_TABLE[-2][1]
+        final_tai_minus_utc = lsst.ts.salobj.base._LEAP_SECOND_TABLE.tai_minus_utc[-2]
         self.assertAlmostEqual(max_tai_unix, max_utc_unix + final_tai_minus_utc)
         with self.assertRaises(ValueError):
             salobj.tai_from_utc(min_utc_unix - 0.001)
         with self.assertRaises(ValueError):
             salobj.tai_from_utc(max_utc_unix + 0.001)
 
+    def test_tai_from_utc_unix_array(self):
+        """Test tai_from_utc_unix_array against tai_from_utc_unix."""
+        # Include times near the leap second transition just before
+        # 2017-01-01, when leap seconds went from 36 to 37,
+        # as well as times near the limits of the leap second table.
+        utc0_unix = astropy.time.Time("2017-01-01", scale="utc", format="iso").unix
+        min_utc_unix = astropy.time.Time("1972-01-01", scale="utc", format="iso").unix
+        max_utc_unix = (
+            lsst.ts.salobj.base._LEAP_SECOND_TABLE.utc[-1] - salobj.SECONDS_PER_DAY
+        )
+        utc_unix_arr = np.concatenate(
+            (
+                utc0_unix + np.linspace(-2, 1, 31) * salobj.SECONDS_PER_DAY,
+                [min_utc_unix, min_utc_unix + 0.1, max_utc_unix - 0.1, max_utc_unix],
+            )
+        )
+        tai_unix_arr = salobj.tai_from_utc_unix_array(utc_unix_arr)
+        self.assertIsInstance(tai_unix_arr, np.ndarray)
+        self.assertEqual(tai_unix_arr.shape, utc_unix_arr.shape)
+        for utc_unix, tai_unix in zip(utc_unix_arr, tai_unix_arr):
+            with self.subTest(utc_unix=utc_unix):
+                self.assertAlmostEqual(
+                    tai_unix, salobj.tai_from_utc_unix(utc_unix), delta=1e-6
+                )
+
+        # A list works as well as an array.
+        tai_unix_arr2 = salobj.tai_from_utc_unix_array(list(utc_unix_arr))
+        np.testing.assert_array_equal(tai_unix_arr, tai_unix_arr2)
+
+        # tai_from_utc calls tai_from_utc_unix_array for arrays.
+        tai_unix_arr3 = salobj.tai_from_utc(utc_unix_arr)
+        np.testing.assert_array_equal(tai_unix_arr, tai_unix_arr3)
+        utc_ap_arr = astropy.time.Time(utc_unix_arr, scale="utc", format="unix")
+        tai_unix_arr4 = salobj.tai_from_utc(utc_ap_arr)
+        np.testing.assert_allclose(tai_unix_arr, tai_unix_arr4, rtol=0, atol=1e-6)
+
+        for bad_utc_unix in (min_utc_unix - 0.001, max_utc_unix + 0.001):
+            with self.subTest(bad_utc_unix=bad_utc_unix):
+                with self.assertRaises(ValueError):
+                    salobj.tai_from_utc_unix_array(
+                        [min_utc_unix, bad_utc_unix, max_utc_unix]
+                    )
+
     def test_current_tai(self):
         utc0 = time.time()
         tai0 = salobj.tai_from_utc(utc0)
@@ -19,6 +19,9 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
+import os
+import pathlib
+import tempfile
 import unittest
 import unittest.mock
 
@@ -44,6 +47,29 @@ class DdsUtilsTestCase(unittest.TestCase):
                     dds_version = salobj.get_dds_version()
                     self.assertEqual(dds_version, desired_version)
 
+    def test_get_dds_classes_from_idl_cache(self):
+        type_name = "Test::logevent_summaryState_1234"
+        with tempfile.TemporaryDirectory() as tempdir, unittest.mock.patch(
+            "ddsutil.get_dds_classes_from_idl",
+            side_effect=lambda idl_path, type_name: object(),
+        ) as mock_get_classes:
+            idl_path = pathlib.Path(tempdir) / "sal_revCoded_Test.idl"
+            idl_path.write_text("// not parsed by the mock\n")
+            dds_classes = salobj.get_dds_classes_from_idl(idl_path, type_name)
+            mock_get_classes.assert_called_once_with(idl_path, type_name)
+            self.assertIs(
+                salobj.get_dds_classes_from_idl(idl_path, type_name), dds_classes
+            )
+            self.assertEqual(mock_get_classes.call_count, 1)
+
+            # Changing the modification time of the file
+            # should force the classes to be generated again.
+            mtime_ns = idl_path.stat().st_mtime_ns + 1_000_000_000
+            os.utime(idl_path, ns=(mtime_ns, mtime_ns))
+            new_dds_classes = salobj.get_dds_classes_from_idl(idl_path, type_name)
+            self.assertIsNot(new_dds_classes, dds_classes)
+            self.assertEqual(mock_get_classes.call_count, 2)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -19,8 +19,11 @@
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <https://www.gnu.org/licenses/>.
 
-import unittest
+import os
 import pathlib
+import shutil
+import tempfile
+import unittest
 
 from lsst.ts import idl
 from lsst.ts import salobj
@@ -36,6 +39,23 @@ class IdlParserTestCase(unittest.TestCase):
     def test_parse_simple_without_metadata(self):
         self.check_parse_simple(has_metadata=False)
 
+    def test_parse_idl_cache(self):
+        with tempfile.TemporaryDirectory() as tempdir:
+            idl_path = pathlib.Path(tempdir) / "sal_revCoded_Simple.idl"
+            shutil.copy(
+                self.data_path / "sal_revCoded_SimpleWithMetadata.idl", idl_path
+            )
+            metadata = salobj.parse_idl(name="Simple", idl_path=idl_path)
+            self.assertIs(salobj.parse_idl(name="Simple", idl_path=idl_path), metadata)
+
+            # Changing the modification time of the file
+            # should force it to be parsed again.
+            mtime_ns = idl_path.stat().st_mtime_ns + 1_000_000_000
+            os.utime(idl_path, ns=(mtime_ns, mtime_ns))
+            new_metadata = salobj.parse_idl(name="Simple", idl_path=idl_path)
+            self.assertIsNot(new_metadata, metadata)
+            self.assertEqual(new_metadata.topic_info.keys(), metadata.topic_info.keys())
+
     def check_parse_simple(self, has_metadata):
         """Parse one of the Simple IDL files and check all of the
         resulting metadata.
@@ -39,6 +39,22 @@ np.random.seed(47)
 index_gen = salobj.index_generator()
 
 
+def get_topic_attr_names(remote):
+    """Get the names of the topic attributes of a remote.
+
+    Returns
+    -------
+    names : `tuple` [`set` [`str`]]
+        Three sets of attribute names: commands (``cmd_``),
+        events (``evt_``), and telemetry (``tel_``).
+    """
+    names = dir(remote)
+    return tuple(
+        set(name for name in names if name.startswith(prefix))
+        for prefix in ("cmd_", "evt_", "tel_")
+    )
+
+
 class RemoteTestCase(unittest.IsolatedAsyncioTestCase):
     async def test_constructor_include_exclude(self):
         """Test the include and exclude arguments for salobj.Remote."""
@@ -62,40 +78,24 @@ class RemoteTestCase(unittest.IsolatedAsyncioTestCase):
             # remote0 specifies neither include nor exclude;
             # it should have everything
             remote0 = salobj.Remote(domain=domain, name="Test", index=index)
-            remote_command_names = set(
-                [name for name in dir(remote0) if name.startswith("cmd_")]
-            )
-            self.assertEqual(remote_command_names, all_command_method_names)
-            remote_event_names = set(
-                [name for name in dir(remote0) if name.startswith("evt_")]
-            )
-            self.assertEqual(remote_event_names, all_event_method_names)
-            remote_telemetry_names = set(
-                [name for name in dir(remote0) if name.startswith("tel_")]
-            )
-            self.assertEqual(remote_telemetry_names, all_telemetry_method_names)
+            command_names, event_names, telemetry_names = get_topic_attr_names(remote0)
+            self.assertEqual(command_names, all_command_method_names)
+            self.assertEqual(event_names, all_event_method_names)
+            self.assertEqual(telemetry_names, all_telemetry_method_names)
 
             # remote1 uses the include argument
             include = ["errorCode", "scalars"]
             remote1 = salobj.Remote(
                 domain=domain, name="Test", index=index, include=include
             )
-            remote1_command_names = set(
-                [name for name in dir(remote1) if name.startswith("cmd_")]
-            )
-            self.assertEqual(remote1_command_names, all_command_method_names)
-            remote1_event_names = set(
-                [name for name in dir(remote1) if name.startswith("evt_")]
-            )
+            command_names, event_names, telemetry_names = get_topic_attr_names(remote1)
+            self.assertEqual(command_names, all_command_method_names)
             self.assertEqual(
-                remote1_event_names,
+                event_names,
                 set(f"evt_{name}" for name in include if name in all_event_names),
             )
-            remote1_telemetry_names = set(
-                [name for name in dir(remote1) if name.startswith("tel_")]
-            )
             self.assertEqual(
-                remote1_telemetry_names,
+                telemetry_names,
                 set(f"tel_{name}" for name in include if name in all_telemetry_names),
             )
 
@@ -104,22 +104,14 @@ class RemoteTestCase(unittest.IsolatedAsyncioTestCase):
             remote2 = salobj.Remote(
                 domain=domain, name="Test", index=index, exclude=exclude
             )
-            remote2_command_names = set(
-                [name for name in dir(remote2) if name.startswith("cmd_")]
-            )
-            self.assertEqual(remote2_command_names, all_command_method_names)
-            remote2_event_names = set(
-                [name for name in dir(remote2) if name.startswith("evt_")]
-            )
+            command_names, event_names, telemetry_names = get_topic_attr_names(remote2)
+            self.assertEqual(command_names, all_command_method_names)
             self.assertEqual(
-                remote2_event_names,
+                event_names,
                 set(f"evt_{name}" for name in all_event_names if name not in exclude),
             )
-            remote2_telemetry_names = set(
-                [name for name in dir(remote2) if name.startswith("tel_")]
-            )
             self.assertEqual(
-                remote2_telemetry_names,
+                telemetry_names,
                 set(
                     f"tel_{name}" for name in all_telemetry_names if name not in exclude
                 ),
@@ -129,49 +121,25 @@ class RemoteTestCase(unittest.IsolatedAsyncioTestCase):
             remote3 = salobj.Remote(
                 domain=domain, name="Test", index=index, readonly=True
             )
-            remote_command_names = set(
-                [name for name in dir(remote3) if name.startswith("cmd_")]
-            )
-            self.assertEqual(remote_command_names, set())
-            remote_event_names = set(
-                [name for name in dir(remote3) if name.startswith("evt_")]
-            )
-            self.assertEqual(remote_event_names, all_event_method_names)
-            remote_telemetry_names = set(
-                [name for name in dir(remote3) if name.startswith("tel_")]
-            )
-            self.assertEqual(remote_telemetry_names, all_telemetry_method_names)
+            command_names, event_names, telemetry_names = get_topic_attr_names(remote3)
+            self.assertEqual(command_names, set())
+            self.assertEqual(event_names, all_event_method_names)
+            self.assertEqual(telemetry_names, all_telemetry_method_names)
 
             # remote4 uses include=[]
             remote4 = salobj.Remote(domain=domain, name="Test", index=index, include=[])
-            remote_command_names = set(
-                [name for name in dir(remote4) if name.startswith("cmd_")]
-            )
-            self.assertEqual(remote_command_names, all_command_method_names)
-            remote_event_names = set(
-                [name for name in dir(remote4) if name.startswith("evt_")]
-            )
-            self.assertEqual(remote_event_names, set())
-            remote_telemetry_names = set(
-                [name for name in dir(remote4) if name.startswith("tel_")]
-            )
-            self.assertEqual(remote_telemetry_names, set())
+            command_names, event_names, telemetry_names = get_topic_attr_names(remote4)
+            self.assertEqual(command_names, all_command_method_names)
+            self.assertEqual(event_names, set())
+            self.assertEqual(telemetry_names, set())
 
             # remote5 uses exclude=[] (though there is no reason to doubt
             # that it will work the same as exclude=None)
             remote5 = salobj.Remote(domain=domain, name="Test", index=index, exclude=[])
-            remote_command_names = set(
-                [name for name in dir(remote5) if name.startswith("cmd_")]
-            )
-            self.assertEqual(remote_command_names, all_command_method_names)
-            remote_event_names = set(
-                [name for name in dir(remote5) if name.startswith("evt_")]
-            )
-            self.assertEqual(remote_event_names, all_event_method_names)
-            remote_telemetry_names = set(
-                [name for name in dir(remote5) if name.startswith("tel_")]
-            )
-            self.assertEqual(remote_telemetry_names, all_telemetry_method_names)
+            command_names, event_names, telemetry_names = get_topic_attr_names(remote5)
+            self.assertEqual(command_names, all_command_method_names)
+            self.assertEqual(event_names, all_event_method_names)
+            self.assertEqual(telemetry_names, all_telemetry_method_names)
 
             # make sure one cannot specify both include and exclude
             with self.assertRaises(ValueError):
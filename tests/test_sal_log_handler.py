@@ -0,0 +1,100 @@
+# This file is part of ts_salobj.
+#
+# Developed for the Rubin Observatory Telescope and Site System.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+
+import contextlib
+import io
+import logging
+import types
+import unittest
+
+from lsst.ts import salobj
+
+
+class MockLogMessageTopic:
+    """Record the keyword arguments of each call to ``set_put``.
+
+    Raise RuntimeError instead if ``fail`` is true.
+    """
+
+    def __init__(self):
+        self.fail = False
+        self.messages = []
+
+    def set_put(self, **kwargs):
+        if self.fail:
+            raise RuntimeError("set_put failed on purpose")
+        self.messages.append(kwargs)
+
+
+class SalLogHandlerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.topic = MockLogMessageTopic()
+        controller = types.SimpleNamespace(evt_logMessage=self.topic)
+        self.handler = salobj.SalLogHandler(controller=controller)
+        self.log = logging.getLogger(f"{type(self).__name__}.{self.id()}")
+        self.log.propagate = False
+        self.log.setLevel(logging.INFO)
+        self.log.addHandler(self.handler)
+
+    def tearDown(self):
+        self.log.removeHandler(self.handler)
+
+    def test_emit(self):
+        self.log.info("message %s", 5)
+        self.assertEqual(len(self.topic.messages), 1)
+        data = self.topic.messages[0]
+        self.assertEqual(data["message"], b"message 5")
+        self.assertEqual(data["level"], logging.INFO)
+        self.assertEqual(data["traceback"], "")
+        self.assertEqual(data["functionName"], "test_emit")
+
+        try:
+            raise RuntimeError("raised on purpose")
+        except RuntimeError:
+            self.log.exception("exception message")
+        self.assertEqual(len(self.topic.messages), 2)
+        data = self.topic.messages[1]
+        self.assertEqual(data["message"], b"exception message")
+        self.assertEqual(data["level"], logging.ERROR)
+        self.assertIn(b"Traceback", data["traceback"])
+        self.assertIn(b"raised on purpose", data["traceback"])
+
+    def test_emit_failed(self):
+        self.topic.fail = True
+        stderr = io.StringIO()
+        with contextlib.redirect_stderr(stderr):
+            for i in range(3):
+                self.log.info("message %s", i)
+        self.assertEqual(stderr.getvalue().count("SalLogHandler.emit failed"), 1)
+
+        # A successful write re-enables error reporting.
+        self.topic.fail = False
+        self.log.info("message that is written")
+        self.assertEqual(len(self.topic.messages), 1)
+        self.topic.fail = True
+        with contextlib.redirect_stderr(stderr):
+            self.log.info("another failed message")
+        self.assertEqual(stderr.getvalue().count("SalLogHandler.emit failed"), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -30,7 +30,7 @@ from lsst.ts import salobj
 try:
     import SALPY_Test
 except ImportError:
-    SALPY_Test = None
+    raise unittest.SkipTest("Could not import SALPY_Test")
 
 # Long enough to perform any reasonable operation
 # including starting a CSC or loading a script (seconds)
@@ -39,6 +39,19 @@ STD_TIMEOUT = 60
 INITIAL_LOG_LEVEL = 20
 SAL__CMD_COMPLETE = 303
 
+# Command ack codes that indicate the command is finished.
+DONE_ACK_CODES = frozenset(
+    (
+        SALPY_Test.SAL__CMD_ABORTED,
+        SALPY_Test.SAL__CMD_COMPLETE,
+        SALPY_Test.SAL__CMD_FAILED,
+        SALPY_Test.SAL__CMD_NOACK,
+        SALPY_Test.SAL__CMD_NOPERM,
+        SALPY_Test.SAL__CMD_STALLED,
+        SALPY_Test.SAL__CMD_TIMEOUT,
+    )
+)
+
 index_gen = salobj.index_generator()
 
 
@@ -48,11 +61,9 @@ class SALPYTestCase(unittest.IsolatedAsyncioTestCase):
         self.datadir = pathlib.Path(__file__).resolve().parent / "data"
         self.index = next(index_gen)
 
-    @unittest.skipIf(SALPY_Test is None, "Could not import SALPY_Test")
     async def test_salpy_remote_salobj_controller(self):
         await self.check_salpy_remote("minimal_salobj_controller.py")
 
-    @unittest.skipIf(SALPY_Test is None, "Could not import SALPY_Test")
     async def test_salpy_remote_salpy_controller(self):
         await self.check_salpy_remote("minimal_salpy_controller.py")
 
@@ -99,18 +110,6 @@ class SALPYTestCase(unittest.IsolatedAsyncioTestCase):
                     await asyncio.sleep(0.01)
 
             async def send_setLogLevel(level):
-                done_ack_codes = frozenset(
-                    (
-                        SALPY_Test.SAL__CMD_ABORTED,
-                        SALPY_Test.SAL__CMD_COMPLETE,
-                        SALPY_Test.SAL__CMD_FAILED,
-                        SALPY_Test.SAL__CMD_NOACK,
-                        SALPY_Test.SAL__CMD_NOPERM,
-                        SALPY_Test.SAL__CMD_STALLED,
-                        SALPY_Test.SAL__CMD_TIMEOUT,
-                    )
-                )
-
                 cmd_data = SALPY_Test.Test_command_setLogLevelC()
                 cmd_data.level = level
                 cmd_id = manager.issueCommand_setLogLevel(cmd_data)
@@ -125,7 +124,7 @@ class SALPYTestCase(unittest.IsolatedAsyncioTestCase):
                         self.assertEqual(ack_data.identity, f"Test:{self.index}")
                         if ack_data.ack == SALPY_Test.SAL__CMD_COMPLETE:
                             return ack_data
-                        elif ack_data.ack in done_ack_codes:
+                        elif ack_data.ack in DONE_ACK_CODES:
                             raise RuntimeError(
                                 f"Remote: command failed; ack={ack_data.ack}"
                             )
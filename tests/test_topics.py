@@ -728,17 +728,29 @@ class TopicsTestCase(salobj.BaseCscTestCase, unittest.IsolatedAsyncioTestCase):
                 self.assertEqual(data, read_data)
 
     async def test_callbacks(self):
+        num_commands = 3
+        # Set when both callbacks have been called num_commands times.
+        callbacks_done = asyncio.Event()
+
+        def check_callbacks_done():
+            if (
+                len(evt_data_list) >= num_commands
+                and len(tel_data_list) >= num_commands
+            ):
+                callbacks_done.set()
+
         evt_data_list = []
 
         def evt_callback(data):
             evt_data_list.append(data)
+            check_callbacks_done()
 
         tel_data_list = []
 
         def tel_callback(data):
             tel_data_list.append(data)
+            check_callbacks_done()
 
-        num_commands = 3
         async with self.make_csc(initial_state=salobj.State.ENABLED):
             self.remote.evt_scalars.callback = evt_callback
             self.remote.tel_scalars.callback = tel_callback
@@ -757,8 +769,9 @@ class TopicsTestCase(salobj.BaseCscTestCase, unittest.IsolatedAsyncioTestCase):
                 await self.remote.tel_scalars.next(flush=False)
 
             cmd_data_list = await self.set_scalars(num_commands=num_commands)
-            # give the wait loops time to finish
-            await asyncio.sleep(EVENT_DELAY)
+            await asyncio.wait_for(callbacks_done.wait(), timeout=STD_TIMEOUT)
+            # Give any extra (unwanted) callbacks time to arrive.
+            await asyncio.sleep(NODATA_TIMEOUT)
 
             self.assertEqual(len(evt_data_list), num_commands)
             for cmd_data, evt_data in zip(cmd_data_list, evt_data_list):
@@ -1037,7 +1050,7 @@ class TopicsTestCase(salobj.BaseCscTestCase, unittest.IsolatedAsyncioTestCase):
             for ackcmd in ackcmds:
                 self.assertEqual(ackcmd.ack, salobj.SalRetCode.CMD_COMPLETE)
 
-            expected_duration = np.sum(durations)
+            expected_duration = sum(durations)
             self.assertLess(abs(measured_duration - expected_duration), 0.1)
 
     async def test_remote_command_not_ready(self):